@@ -8,21 +8,34 @@ Features:
 - Historical return analysis with customizable rolling statistics
 - Distribution analysis compared to normal distribution
 - Trading statistics and extreme movement detection
+- Parquet / Arrow IPC export of series, rolling metrics and statistics
 """
 
+import json
+import os
+import tempfile
 import traceback
 from datetime import date
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
 import yfinance as yf
 from scipy.stats import kurtosis, norm, skew
 
 
 # ---- Configuration ----
+EXPORT_FORMATS = {
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file"),
+}
+EXPORT_CHUNK_ROWS = 65_536
+
+
 def setup_page():
     """Configure the Streamlit page settings."""
     st.set_page_config(
@@ -163,6 +176,129 @@ def calculate_metrics(
     return df, stats
 
 
+# ---- Export Functions ----
+def to_scalar(value) -> Optional[float | int]:
+    """Convert a numeric value to a JSON-safe scalar, mapping non-finite values to None."""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def flatten_stats(stats: dict) -> dict:
+    """
+    Convert the statistics dictionary into JSON-serializable scalars.
+
+    Args:
+        stats: Dictionary of calculated statistics
+
+    Returns:
+        Flat dictionary; the latest rolling Series is expanded to
+        "latest_rolling.<column>" keys and non-finite values become None
+    """
+    flat = {}
+    for key, value in stats.items():
+        if isinstance(value, pd.Series):
+            for column, item in value.items():
+                flat[f"{key}.{column}"] = to_scalar(item)
+        else:
+            flat[key] = to_scalar(value)
+    return flat
+
+
+def build_export_schema(
+    analyses: List[Tuple[str, pd.DataFrame, dict]], rolling_window: int
+) -> pa.Schema:
+    """
+    Build the Arrow schema shared by every ticker in an export.
+
+    Args:
+        analyses: List of (ticker, metrics DataFrame, stats) tuples
+        rolling_window: Number of days used in rolling calculations
+
+    Returns:
+        Arrow schema with the summary statistics stored as metadata
+    """
+    _, first_df, _ = analyses[0]
+
+    # Volume may come back as int or float depending on the asset, so cast all to float
+    fields = [pa.field("Ticker", pa.string()), pa.field("Date", pa.timestamp("ns"))]
+    fields += [pa.field(column, pa.float64()) for column in first_df.columns]
+
+    metadata = {
+        "rolling_window": str(rolling_window),
+        "stats": json.dumps(
+            {ticker: flatten_stats(stats) for ticker, _, stats in analyses},
+            allow_nan=False,
+        ),
+    }
+    return pa.schema(fields, metadata=metadata)
+
+
+def iter_record_batches(
+    df: pd.DataFrame,
+    ticker: str,
+    schema: pa.Schema,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield Arrow record batches for a ticker, one chunk of rows at a time.
+
+    Args:
+        df: DataFrame with return data and calculated metrics
+        ticker: Asset ticker symbol
+        schema: Export schema from build_export_schema
+        chunk_rows: Maximum number of rows per batch
+
+    Yields:
+        Arrow RecordBatch objects conforming to the schema
+    """
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows].rename_axis("Date").reset_index()
+        chunk.insert(0, "Ticker", ticker)
+        yield pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+
+
+def write_export(
+    analyses: List[Tuple[str, pd.DataFrame, dict]],
+    sink: str,
+    export_format: str,
+    rolling_window: int,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> int:
+    """
+    Stream price/return series, rolling metrics and stats to a Parquet or Arrow IPC file.
+
+    Rows are written batch by batch so the encoded file is never held in memory.
+
+    Args:
+        analyses: List of (ticker, metrics DataFrame, stats) tuples
+        sink: Output file path
+        export_format: One of the keys of EXPORT_FORMATS
+        rolling_window: Number of days used in rolling calculations
+        chunk_rows: Maximum number of rows per written batch
+
+    Returns:
+        Number of rows written
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    schema = build_export_schema(analyses, rolling_window)
+    if export_format == "Parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(sink, schema)
+
+    rows = 0
+    with writer:
+        for ticker, df, _ in analyses:
+            for batch in iter_record_batches(df, ticker, schema, chunk_rows):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
+
+
 # ---- Visualization Functions ----
 def create_returns_timeseries(df: pd.DataFrame, rolling_window: int = 30) -> go.Figure:
     """
@@ -418,6 +554,7 @@ def render_sidebar() -> Tuple[str, date, date, int]:
         - Return distribution visualization
         - Trading day performance metrics
         - Extreme movement detection
+        - Parquet / Arrow IPC data export
         """
     )
 
@@ -546,6 +683,72 @@ def render_trading_report(stats: dict, ticker: str) -> None:
     """)
 
 
+def render_export_section(
+    ticker: str,
+    asset_df: pd.DataFrame,
+    stats: dict,
+    start_date: date,
+    end_date: date,
+    rolling_window: int,
+) -> None:
+    """
+    Render the export controls for single- or multi-ticker Parquet/Arrow downloads.
+
+    Args:
+        ticker: Asset ticker symbol currently analyzed
+        asset_df: DataFrame with return data and calculated metrics for the ticker
+        stats: Dictionary of calculated statistics for the ticker
+        start_date: Start date for data retrieval
+        end_date: End date for data retrieval
+        rolling_window: Number of days used in rolling calculations
+    """
+    col1, col2 = st.columns((3, 1))
+
+    with col1:
+        extra_tickers = st.text_input(
+            "Additional Tickers (comma-separated, optional)",
+            help="Export a batch of tickers alongside the current one",
+        )
+    with col2:
+        export_format = st.radio("Format", list(EXPORT_FORMATS), horizontal=True)
+
+    if not st.button("Prepare Export"):
+        return
+
+    ticker = ticker.strip().upper()
+    analyses = [(ticker, asset_df, stats)]
+    for extra in dict.fromkeys(t.strip().upper() for t in extra_tickers.split(",")):
+        if not extra or extra == ticker:
+            continue
+        extra_df = get_asset_data(extra, start_date, end_date)
+        if extra_df is None:
+            continue
+        if len(extra_df) < rolling_window:
+            st.warning(
+                f"⚠️ Skipped '{extra}': only {len(extra_df)} trading days, "
+                f"not enough for a {rolling_window}-day rolling window"
+            )
+            continue
+        analyses.append((extra, *calculate_metrics(extra_df, rolling_window)))
+
+    # Keep the download name bounded however many tickers are in the batch
+    extension, mime = EXPORT_FORMATS[export_format]
+    batch_label = (
+        ticker if len(analyses) == 1 else f"{ticker}_and_{len(analyses) - 1}_more"
+    )
+    file_name = f"{batch_label}_{rolling_window}d.{extension}"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_path = os.path.join(tmp_dir, f"export.{extension}")
+        rows = write_export(analyses, export_path, export_format, rolling_window)
+        with open(export_path, "rb") as export_file:
+            st.download_button(
+                f"⬇️ Download {export_format} ({rows} rows)",
+                data=export_file,
+                file_name=file_name,
+                mime=mime,
+            )
+
+
 def interpret_skewness(skew_value: float) -> str:
     """Provide interpretation of skewness values."""
     if skew_value > 0.5:
@@ -659,6 +862,12 @@ def main():
             5. **Drawdown Analysis**: Duration and magnitude of peak-to-trough moves
             """)
 
+        # Export section
+        with st.expander("📦 Export Series, Rolling Metrics and Stats"):
+            render_export_section(
+                ticker, asset_df, stats, start_date, end_date, rolling_window
+            )
+
     else:
         st.warning("Enter a valid ticker symbol to begin analysis")
 
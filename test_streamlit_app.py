@@ -0,0 +1,69 @@
+"""Round-trip checks for the Parquet / Arrow IPC export."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from streamlit_app import EXPORT_FORMATS, calculate_metrics, write_export
+
+ROLLING_WINDOW = 3
+
+
+def make_asset_df(close: list) -> pd.DataFrame:
+    """Build a yfinance-shaped frame with an int Volume column."""
+    index = pd.date_range("2024-01-01", periods=len(close), name="Date")
+    df = pd.DataFrame(
+        {
+            "Close": close,
+            "High": close,
+            "Low": close,
+            "Open": close,
+            "Volume": np.arange(len(close), dtype="int64"),
+        },
+        index=index,
+    )
+    df["Return"] = df["Close"].pct_change()
+    return df.dropna()
+
+
+@pytest.mark.parametrize("export_format", list(EXPORT_FORMATS))
+def test_write_export_round_trip(tmp_path, export_format):
+    analyses = [
+        # Constant prices give zero returns, so skewness and kurtosis are NaN
+        ("FLAT", *calculate_metrics(make_asset_df([100.0] * 8), ROLLING_WINDOW)),
+        (
+            "MOVE",
+            *calculate_metrics(
+                make_asset_df([100.0, 101.0, 99.5, 102.0, 103.0, 101.0]),
+                ROLLING_WINDOW,
+            ),
+        ),
+    ]
+    extension, _ = EXPORT_FORMATS[export_format]
+    path = tmp_path / f"export.{extension}"
+
+    rows = write_export(analyses, str(path), export_format, ROLLING_WINDOW, 2)
+
+    if export_format == "Parquet":
+        table = pq.read_table(path)
+    else:
+        with pa.ipc.open_file(path) as reader:
+            table = reader.read_all()
+
+    assert rows == table.num_rows == 7 + 5
+    assert table.column("Ticker").to_pylist() == ["FLAT"] * 7 + ["MOVE"] * 5
+    assert table.schema.field("Date").type == pa.timestamp("ns")
+    for name in table.schema.names[2:]:
+        assert table.schema.field(name).type == pa.float64()
+
+    metadata = table.schema.metadata
+    assert metadata[b"rolling_window"] == str(ROLLING_WINDOW).encode()
+    stats = json.loads(metadata[b"stats"])
+    assert set(stats) == {"FLAT", "MOVE"}
+    assert stats["FLAT"]["skewness"] is None
+    assert stats["FLAT"]["total_days"] == 7
+    assert isinstance(stats["MOVE"]["skewness"], float)